@@ -1,83 +1,240 @@
 import os
+import atexit
 import logging
-import json
+import queue
 import asyncio
-import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
+from html import escape
+from pathlib import Path
+from types import MappingProxyType
 import feedparser
+import ujson as json
 from telegram import Bot, Update
+from telegram.error import RetryAfter, TelegramError, TimedOut
 from telegram.ext import Application, CommandHandler, ContextTypes, JobQueue
-from flask import Flask, render_template, jsonify
+from aiohttp import web
 
 # Import configuration
 from config import config
+from rate_limiter import TokenBucket
+
+class PollingTimeoutFilter(logging.Filter):
+    """Drop the routine read timeouts that long polling produces."""
+
+    def filter(self, record):
+        return not (record.exc_info and isinstance(record.exc_info[1], TimedOut))
+
+# Set up logging: handlers only enqueue, a background listener does the writing
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.addFilter(PollingTimeoutFilter())
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+logging.getLogger().addHandler(queue_handler)
+logging.getLogger().setLevel(logging.INFO)
+log_listener = QueueListener(log_queue, stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+logger = logging.getLogger(__name__)
 
-# Set up logging
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", 
-    level=logging.INFO
+# httpx logs every getUpdates round-trip at INFO level
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Reply templates, filled per call with str.format_map
+START_TEMPLATE = (
+    "🤖 <b>RSS Feed Bot Started!</b>\n\n"
+    "✅ <b>Real-time monitoring:</b> Every {interval_minutes} minutes\n"
+    "📊 <b>Daily summary:</b> {summary_hour}:00 daily\n"
+    "📡 <b>Feed URL:</b> {feed_url}\n"
+    "👥 <b>Chat ID:</b> {chat_id}\n\n"
+    "<i>Bot is now actively monitoring for new posts!</i>"
 )
-logger = logging.getLogger(__name__)
 
-# Flask App
-flask_app = Flask(__name__, template_folder="templates")
+STATS_TEMPLATE = (
+    "<b>📈 RSS Bot Statistics</b>\n\n"
+    "📊 Total posts sent: <b>{sent_count}</b>\n"
+    "📅 Bot started: <b>{now}</b>\n"
+    "⏰ Check interval: <b>{interval_minutes} minutes</b>\n"
+    "📢 Daily summary: <b>{summary_hour}:00</b>\n\n"
+    "<i>Bot is running smoothly! 🚀</i>"
+)
 
-@flask_app.route("/")
-def index():
+# Values that stay fixed for the life of the process, HTML-escaped once;
+# exposed read-only so no handler can mutate the shared context
+TEMPLATE_CONTEXT = MappingProxyType({
+    "interval_minutes": config.CHECK_INTERVAL_SECONDS // 60,
+    "summary_hour": config.DAILY_SUMMARY_HOUR,
+    "feed_url": escape(config.RSS_FEED_URL),
+    "chat_id": escape(str(config.CHAT_ID)),
+})
+
+# Only command messages are handled, so Telegram need not send anything else
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# Job queue names shared by /start, /status and /stop
+RSS_JOB_NAME = 'rss_checker'
+DAILY_JOB_NAME = 'daily_summary'
+HEARTBEAT_JOB_NAME = 'heartbeat'
+
+# /health reports stale once the heartbeat job misses a couple of ticks
+HEARTBEAT_INTERVAL_SECONDS = 30
+HEARTBEAT_TIMEOUT_SECONDS = 75
+
+# Worker threads for blocking I/O so the polling loop never waits on the network
+io_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="rss-io")
+# A single writer thread for state files: a slow feed download can never hold
+# up a save, and one worker keeps writes ordered without extra locking
+disk_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rss-disk")
+
+# Timestamps only change once per second, so formatted strings are cached per format
+ISO_SECONDS_FORMAT = '%Y-%m-%dT%H:%M:%S'
+_formatted_now = {}
+
+def format_now(fmt):
+    """Return the current local time formatted with fmt, reusing it within the same second."""
+    second = int(time.time())
+    cached = _formatted_now.get(fmt)
+    if cached is None or cached[0] != second:
+        cached = _formatted_now[fmt] = (second, time.strftime(fmt, time.localtime(second)))
+    return cached[1]
+
+# Web dashboard, served by aiohttp on the bot's own event loop
+INDEX_HTML = Path(__file__).with_name("templates").joinpath("index.html").read_text(encoding="utf-8")
+
+async def index_handler(request):
     """Main dashboard page"""
-    return render_template("index.html")
-
-@flask_app.route("/health")
-def health():
-    """Health check endpoint"""
-    return jsonify({"status": "ok", "timestamp": datetime.now().isoformat()})
-
-@flask_app.route("/status")
-def status():
+    return web.Response(text=INDEX_HTML, content_type="text/html")
+
+async def health_handler(request):
+    """Health check endpoint, answered from the job queue heartbeat"""
+    heartbeat_age = time.monotonic() - rss_bot.last_heartbeat
+    healthy = heartbeat_age < HEARTBEAT_TIMEOUT_SECONDS
+    health_info = {
+        "status": "ok" if healthy else "stale",
+        "heartbeat_age_seconds": round(heartbeat_age, 1),
+        "timestamp": format_now(ISO_SECONDS_FORMAT)
+    }
+    return web.json_response(health_info, status=200 if healthy else 503, dumps=json.dumps)
+
+async def status_handler(request):
     """Bot status API endpoint"""
-    if 'rss_bot' in globals():
-        status_info = {
-            "status": "running",
-            "sent_posts_count": len(rss_bot.sent_links),
-            "last_updated": datetime.now().isoformat(),
-            "feed_url": config.RSS_FEED_URL,
-            "check_interval": config.CHECK_INTERVAL_SECONDS
-        }
-    else:
-        status_info = {"status": "bot_not_initialized"}
-    
-    return jsonify(status_info)
-
-@flask_app.route("/metrics")
-def metrics():
+    status_info = {
+        "status": "running",
+        "sent_posts_count": len(rss_bot.sent_links),
+        "last_updated": format_now(ISO_SECONDS_FORMAT),
+        "feed_url": config.RSS_FEED_URL,
+        "check_interval": config.CHECK_INTERVAL_SECONDS
+    }
+    return web.json_response(status_info, dumps=json.dumps)
+
+async def metrics_handler(request):
     """Basic metrics endpoint"""
-    if 'rss_bot' in globals():
-        metrics_data = {
-            "total_posts_sent": len(rss_bot.sent_links),
-            "bot_uptime": "unknown",  # You could track this with startup time
-            "feed_url": config.RSS_FEED_URL,
-            "chat_id": config.CHAT_ID
-        }
-    else:
-        metrics_data = {"error": "bot_not_available"}
-    
-    return jsonify(metrics_data)
-
-def run_flask():
-    """Run Flask app in a separate thread"""
-    logger.info("Starting Flask web server on port 8000")
-    flask_app.run(host="0.0.0.0", port=8000, debug=False, use_reloader=False)
+    metrics_data = {
+        "total_posts_sent": len(rss_bot.sent_links),
+        "bot_uptime": "unknown",  # You could track this with startup time
+        "feed_url": config.RSS_FEED_URL,
+        "chat_id": config.CHAT_ID
+    }
+    return web.json_response(metrics_data, dumps=json.dumps)
+
+def create_web_app():
+    """Create and configure the dashboard web application"""
+    app = web.Application()
+    app.router.add_get("/", index_handler)
+    app.router.add_get("/health", health_handler)
+    app.router.add_get("/status", status_handler)
+    app.router.add_get("/metrics", metrics_handler)
+    return app
+
+async def start_web_server(application: Application):
+    """post_init hook: start the dashboard and heartbeat alongside the bot"""
+    runner = web.AppRunner(create_web_app())
+    await runner.setup()
+    site = web.TCPSite(runner, config.WEB_SERVER_HOST, config.WEB_SERVER_PORT)
+    await site.start()
+    application.bot_data["web_runner"] = runner
+    logger.info(f"Web dashboard available at http://{config.WEB_SERVER_HOST}:{config.WEB_SERVER_PORT}")
+
+    # Liveness is proven by the job queue ticking, not by calling the Telegram API
+    application.job_queue.run_repeating(
+        rss_bot.heartbeat,
+        interval=HEARTBEAT_INTERVAL_SECONDS,
+        first=0,
+        name=HEARTBEAT_JOB_NAME
+    )
+
+async def stop_web_server(application: Application):
+    """post_shutdown hook: release the dashboard port"""
+    runner = application.bot_data.pop("web_runner", None)
+    if runner is not None:
+        await runner.cleanup()
 
 class RSSBot:
     def __init__(self):
         self.sent_links = self.load_sent_links()
+        self.last_heartbeat = time.monotonic()
+        self.chat_buckets = {}
+        # Last good parse of the feed, reused when the server answers 304 Not Modified
+        self.cached_feed = None
+        # Bot-wide ceiling of ~30 messages per second across all chats
+        self.global_bucket = TokenBucket(capacity=30, refill_rate=28)
         
+    def get_bucket(self, chat_id):
+        """Return the token bucket that throttles messages to a chat."""
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self.chat_buckets[chat_id] = TokenBucket()
+        return bucket
+
+    async def send_throttled(self, bot, chat_id, **kwargs):
+        """Send a message once the chat's bucket allows it, honouring Retry-After."""
+        bucket = self.get_bucket(chat_id)
+        while True:
+            await bucket.acquire()
+            await self.global_bucket.acquire()
+            try:
+                return await bot.send_message(chat_id=chat_id, **kwargs)
+            except RetryAfter as e:
+                logger.warning(f"Rate limited by Telegram for chat {chat_id}, retrying in {e.retry_after}s")
+                bucket.back_off(e.retry_after)
+
+    async def heartbeat(self, context: ContextTypes.DEFAULT_TYPE):
+        """Record that the event loop and job queue are still running."""
+        self.last_heartbeat = time.monotonic()
+
+    async def fetch_feed(self):
+        """Download and parse the RSS feed off the event loop.
+
+        Sends the ETag/Last-Modified of the previous response so an unchanged
+        feed costs a 304 instead of a full download and re-parse.
+        """
+        cached = self.cached_feed
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(
+            io_pool,
+            partial(
+                feedparser.parse,
+                config.RSS_FEED_URL,
+                etag=cached.get('etag') if cached else None,
+                modified=cached.get('modified') if cached else None,
+            ),
+        )
+        if cached is not None and feed.get('status') == 304:
+            return cached
+        if not feed.bozo:
+            self.cached_feed = feed
+        return feed
+
     def load_last_link(self):
         """Loads the last sent link from the persistence file."""
-        if os.path.exists(config.LAST_SENT_FILE):
-            with open(config.LAST_SENT_FILE, 'r') as f:
-                return f.read().strip()
-        return ""
+        try:
+            return Path(config.LAST_SENT_FILE).read_text().strip()
+        except FileNotFoundError:
+            return ""
 
     def save_last_link(self, link):
         """Saves the latest link to the persistence file."""
@@ -86,28 +243,39 @@ class RSSBot:
 
     def load_sent_links(self):
         """Load all sent links from JSON file to avoid duplicates across restarts."""
-        if os.path.exists(config.SENT_LINKS_FILE):
-            try:
-                with open(config.SENT_LINKS_FILE, 'r') as f:
-                    return set(json.load(f))
-            except Exception as e:
-                logger.error(f"Error loading sent links: {e}")
+        try:
+            with open(config.SENT_LINKS_FILE, 'r') as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading sent links: {e}")
         return set()
 
-    def save_sent_links(self):
+    def save_sent_links(self, links):
         """Save sent links to JSON file."""
+        # Write to a temp file and rename so a crash never leaves a truncated file
+        tmp_path = f"{config.SENT_LINKS_FILE}.tmp"
         try:
-            with open(config.SENT_LINKS_FILE, 'w') as f:
-                json.dump(list(self.sent_links), f)
+            with open(tmp_path, 'w') as f:
+                json.dump(links, f)
+            os.replace(tmp_path, config.SENT_LINKS_FILE)
         except Exception as e:
             logger.error(f"Error saving sent links: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
+
+    async def persist_sent_links(self):
+        """Snapshot the sent links on the loop, then write them on the disk pool."""
+        links = list(self.sent_links)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(disk_pool, self.save_sent_links, links)
 
     async def check_new_posts(self, context: ContextTypes.DEFAULT_TYPE):
         """The function scheduled to run periodically to check the RSS feed."""
         logger.info("Starting scheduled RSS feed check...")
 
         try:
-            feed = feedparser.parse(config.RSS_FEED_URL)
+            feed = await self.fetch_feed()
             
             # Check if feed was parsed successfully
             if feed.bozo:
@@ -119,13 +287,14 @@ class RSSBot:
             return
 
         new_posts = []
+        sent_links = self.sent_links
 
         # Iterate through entries in reverse chronological order (newest first)
         for entry in feed.entries:
             link = entry.link
             
             # Skip if we've already sent this link
-            if link in self.sent_links:
+            if link in sent_links:
                 continue
             
             # Prepare post data
@@ -134,12 +303,13 @@ class RSSBot:
             summary = getattr(entry, 'summary', '')[:200]  # Truncate summary
             
             # Create formatted message
-            message = f"<b>📰 {title}</b>\n"
+            # Feed text is untrusted: escape it so stray <, > or & never break HTML parsing
+            message = f"<b>📰 {escape(title)}</b>\n"
             if published:
-                message += f"📅 {published}\n"
+                message += f"📅 {escape(published)}\n"
             if summary:
-                message += f"📝 {summary}...\n"
-            message += f"🔗 <a href='{link}'>Read Full Story</a>"
+                message += f"📝 {escape(summary)}...\n"
+            message += f"🔗 <a href='{escape(link)}'>Read Full Story</a>"
             
             new_posts.append((link, message))
 
@@ -148,39 +318,43 @@ class RSSBot:
             return
 
         # Send all new posts to the chat
+        bot = context.bot
+        chat_id = config.CHAT_ID
         sent_count = 0
         for link, message in new_posts:
             try:
-                await context.bot.send_message(
-                    chat_id=config.CHAT_ID,
+                await self.send_throttled(
+                    bot,
+                    chat_id,
                     text=message,
                     parse_mode='HTML',
                     disable_web_page_preview=False
                 )
-                self.sent_links.add(link)
+                sent_links.add(link)
                 sent_count += 1
-                logger.info(f"Sent new post: {link}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Sent new post: {link}")
                 
-                # Add small delay between messages to avoid rate limiting
-                await asyncio.sleep(1)
+                # Persist after every post so a restart mid-batch does not resend it
+                await self.persist_sent_links()
                 
-            except Exception as e:
-                logger.error(f"Error sending message for link {link}: {e}")
-        
-        # Save the updated sent links
-        self.save_sent_links()
+            except TelegramError as e:
+                # Expected API failures (chat not found, bot blocked...): no traceback
+                logger.warning(f"Telegram refused post {link}: {e}")
+            except Exception:
+                logger.exception(f"Unexpected error sending message for link {link}")
         
         # Update last sent link to the newest one
         if sent_count > 0:
             latest_link = feed.entries[0].link
-            self.save_last_link(latest_link)
+            await asyncio.get_running_loop().run_in_executor(disk_pool, self.save_last_link, latest_link)
             logger.info(f"Updated last sent link to: {latest_link}")
             logger.info(f"Successfully sent {sent_count} new posts")
 
     async def send_daily_summary(self, context: ContextTypes.DEFAULT_TYPE):
         """Send a daily summary of RSS feed activity."""
         try:
-            feed = feedparser.parse(config.RSS_FEED_URL)
+            feed = await self.fetch_feed()
             
             if feed.bozo:
                 logger.error(f"RSS feed parsing error in daily summary: {feed.bozo_exception}")
@@ -207,7 +381,7 @@ class RSSBot:
                 for i, entry in enumerate(today_posts[:5], 1):  # Show max 5 posts in summary
                     title = entry.title
                     link = entry.link
-                    summary_message += f"{i}. <a href='{link}'>{title}</a>\n"
+                    summary_message += f"{i}. <a href='{escape(link)}'>{escape(title)}</a>\n"
                 
                 if len(today_posts) > 5:
                     summary_message += f"\n... and {len(today_posts) - 5} more posts."
@@ -219,24 +393,24 @@ class RSSBot:
                 summary_message += "No new posts found today.\n"
                 summary_message += "The bot is still actively monitoring the feed. ✅"
 
-            await context.bot.send_message(
-                chat_id=config.CHAT_ID,
+            await self.send_throttled(
+                context.bot,
+                config.CHAT_ID,
                 text=summary_message,
                 parse_mode='HTML',
                 disable_web_page_preview=True
             )
             logger.info("Daily summary sent successfully")
 
-        except Exception as e:
-            logger.error(f"Error sending daily summary: {e}")
+        except TelegramError as e:
+            logger.warning(f"Telegram refused daily summary: {e}")
+        except Exception:
+            logger.exception("Unexpected error sending daily summary")
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Sends a welcome message when the /start command is issued."""
-        job_name = 'rss_checker'
-        daily_job_name = 'daily_summary'
-        
-        jobs_running = bool(context.job_queue.get_jobs_by_name(job_name))
-        daily_jobs_running = bool(context.job_queue.get_jobs_by_name(daily_job_name))
+        jobs_running = bool(context.job_queue.get_jobs_by_name(RSS_JOB_NAME))
+        daily_jobs_running = bool(context.job_queue.get_jobs_by_name(DAILY_JOB_NAME))
 
         if not jobs_running:
             # Start periodic checking
@@ -244,7 +418,7 @@ class RSSBot:
                 self.check_new_posts, 
                 interval=config.CHECK_INTERVAL_SECONDS, 
                 first=10,  # Start after 10 seconds
-                name=job_name
+                name=RSS_JOB_NAME
             )
 
         if not daily_jobs_running:
@@ -261,81 +435,80 @@ class RSSBot:
                 self.send_daily_summary,
                 interval=86400,  # 24 hours
                 first=seconds_until_target,
-                name=daily_job_name
+                name=DAILY_JOB_NAME
             )
 
-        text = (
-            f"🤖 <b>RSS Feed Bot Started!</b>\n\n"
-            f"✅ <b>Real-time monitoring:</b> Every {config.CHECK_INTERVAL_SECONDS // 60} minutes\n"
-            f"📊 <b>Daily summary:</b> {config.DAILY_SUMMARY_HOUR}:00 daily\n"
-            f"📡 <b>Feed URL:</b> {config.RSS_FEED_URL}\n"
-            f"👥 <b>Chat ID:</b> {config.CHAT_ID}\n\n"
-            f"<i>Bot is now actively monitoring for new posts!</i>"
-        )
-
+        text = START_TEMPLATE.format_map(TEMPLATE_CONTEXT)
         await update.message.reply_text(text, parse_mode='HTML')
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Check bot status and statistics with enhanced HTML formatting."""
-        job_name = 'rss_checker'
-        daily_job_name = 'daily_summary'
+        jobs = context.job_queue.get_jobs_by_name(RSS_JOB_NAME)
+        daily_jobs = context.job_queue.get_jobs_by_name(DAILY_JOB_NAME)
         
-        jobs = context.job_queue.get_jobs_by_name(job_name)
-        daily_jobs = context.job_queue.get_jobs_by_name(daily_job_name)
-        
-        # Enhanced HTML formatting
-        status_text = "🤖 <b>RSS Bot Status</b>\n\n"
+        # Enhanced HTML formatting, collected as lines and joined once
+        lines = ["🤖 <b>RSS Bot Status</b>", ""]
         
         # Monitoring Status with emojis and better formatting
         if jobs:
             next_check = jobs[0].next_t
-            status_text += "🟢 <b>Real-time Monitoring</b>\n"
-            status_text += f"   ⏰ Next check: <code>{next_check.strftime('%H:%M:%S')}</code>\n"
-            status_text += f"   🔄 Interval: <code>{config.CHECK_INTERVAL_SECONDS // 60} minutes</code>\n"
+            lines += [
+                "🟢 <b>Real-time Monitoring</b>",
+                f"   ⏰ Next check: <code>{next_check.strftime('%H:%M:%S')}</code>",
+                f"   🔄 Interval: <code>{config.CHECK_INTERVAL_SECONDS // 60} minutes</code>",
+            ]
         else:
-            status_text += "🔴 <b>Real-time Monitoring</b>\n"
-            status_text += "   ❌ <i>Inactive - Use /start to activate</i>\n"
+            lines += [
+                "🔴 <b>Real-time Monitoring</b>",
+                "   ❌ <i>Inactive - Use /start to activate</i>",
+            ]
         
-        status_text += "\n"
+        lines.append("")
         
         # Daily Summary Status
         if daily_jobs:
             next_daily = daily_jobs[0].next_t
-            status_text += "🟢 <b>Daily Summary</b>\n"
-            status_text += f"   ⏰ Next summary: <code>{next_daily.strftime('%Y-%m-%d %H:%M')}</code>\n"
-            status_text += f"   🕘 Scheduled: <code>{config.DAILY_SUMMARY_HOUR}:00 daily</code>\n"
+            lines += [
+                "🟢 <b>Daily Summary</b>",
+                f"   ⏰ Next summary: <code>{next_daily.strftime('%Y-%m-%d %H:%M')}</code>",
+                f"   🕘 Scheduled: <code>{config.DAILY_SUMMARY_HOUR}:00 daily</code>",
+            ]
         else:
-            status_text += "🔴 <b>Daily Summary</b>\n"
-            status_text += "   ❌ <i>Inactive - Use /start to activate</i>\n"
+            lines += [
+                "🔴 <b>Daily Summary</b>",
+                "   ❌ <i>Inactive - Use /start to activate</i>",
+            ]
         
-        status_text += "\n"
-        status_text += "📊 <b>Statistics</b>\n"
-        status_text += f"   📈 Total posts sent: <b>{len(self.sent_links)}</b>\n"
-        status_text += f"   📡 Feed URL: <code>{config.RSS_FEED_URL}</code>\n"
-        status_text += f"   👥 Chat ID: <code>{config.CHAT_ID}</code>\n"
+        lines += [
+            "",
+            "📊 <b>Statistics</b>",
+            f"   📈 Total posts sent: <b>{len(self.sent_links)}</b>",
+            f"   📡 Feed URL: <code>{TEMPLATE_CONTEXT['feed_url']}</code>",
+            f"   👥 Chat ID: <code>{TEMPLATE_CONTEXT['chat_id']}</code>",
+        ]
         
-        last_link = self.load_last_link()
+        last_link = await asyncio.get_running_loop().run_in_executor(disk_pool, self.load_last_link)
         if last_link:
-            status_text += f"   📎 Last sent: <code>{last_link[:50]}...</code>\n"
+            lines.append(f"   📎 Last sent: <code>{escape(last_link[:50])}...</code>")
         else:
-            status_text += "   📎 Last sent: <i>None</i>\n"
+            lines.append("   📎 Last sent: <i>None</i>")
         
-        status_text += "\n"
-        status_text += "💡 <b>Commands</b>\n"
-        status_text += "   /check - Fetch new posts now\n"
-        status_text += "   /stats - Detailed statistics\n"
-        status_text += "   /stop - Stop monitoring\n"
-        status_text += "   /start - Restart monitoring"
+        lines += [
+            "",
+            "💡 <b>Commands</b>",
+            "   /check - Fetch new posts now",
+            "   /stats - Detailed statistics",
+            "   /stop - Stop monitoring",
+            "   /start - Restart monitoring",
+        ]
+        status_text = "\n".join(lines)
 
         await update.message.reply_text(status_text, parse_mode='HTML')
 
     async def stop_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Stop the RSS monitoring."""
-        job_name = 'rss_checker'
-        daily_job_name = 'daily_summary'
-        
-        jobs = context.job_queue.get_jobs_by_name(job_name)
-        daily_jobs = context.job_queue.get_jobs_by_name(daily_job_name)
+        jobs = context.job_queue.get_jobs_by_name(RSS_JOB_NAME)
+        daily_jobs = context.job_queue.get_jobs_by_name(DAILY_JOB_NAME)
         
         stopped_count = 0
         for job in jobs + daily_jobs:
@@ -355,19 +528,57 @@ class RSSBot:
 
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show detailed statistics."""
-        stats_text = (
-            f"<b>📈 RSS Bot Statistics</b>\n\n"
-            f"📊 Total posts sent: <b>{len(self.sent_links)}</b>\n"
-            f"📅 Bot started: <b>{datetime.now().strftime('%Y-%m-%d %H:%M')}</b>\n"
-            f"⏰ Check interval: <b>{config.CHECK_INTERVAL_SECONDS // 60} minutes</b>\n"
-            f"📢 Daily summary: <b>{config.DAILY_SUMMARY_HOUR}:00</b>\n\n"
-            f"<i>Bot is running smoothly! 🚀</i>"
-        )
+        stats_text = STATS_TEMPLATE.format_map({
+            **TEMPLATE_CONTEXT,
+            "sent_count": len(self.sent_links),
+            "now": format_now('%Y-%m-%d %H:%M'),
+        })
         await update.message.reply_text(stats_text, parse_mode='HTML')
 
 # Global bot instance
 rss_bot = RSSBot()
 
+def build_application():
+    """Create the Telegram Application and register command handlers."""
+    application = (
+        Application.builder()
+        .token(config.BOT_TOKEN)
+        .get_updates_read_timeout(config.POLLING_TIMEOUT + 15)
+        .post_init(start_web_server)
+        .post_shutdown(stop_web_server)
+        .build()
+    )
+
+    # Add command handlers
+    application.add_handler(CommandHandler("start", rss_bot.start_command))
+    application.add_handler(CommandHandler("status", rss_bot.status_command))
+    application.add_handler(CommandHandler("stop", rss_bot.stop_command))
+    application.add_handler(CommandHandler("check", rss_bot.force_check_command))
+    application.add_handler(CommandHandler("stats", rss_bot.stats_command))
+    return application
+
+def run_application(application):
+    """Serve updates until a stop signal, via webhook or long polling."""
+    if config.WEBHOOK_URL:
+        # Telegram pushes updates to us, no getUpdates round-trips
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=config.WEBHOOK_PORT,
+            url_path=config.BOT_TOKEN,
+            webhook_url=config.WEBHOOK_ENDPOINT,
+            secret_token=config.WEBHOOK_SECRET,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True
+        )
+    else:
+        # Start polling - no port needed for Telegram polling; deleteWebhook
+        # with drop_pending_updates discards commands queued while we were down
+        application.run_polling(
+            timeout=config.POLLING_TIMEOUT,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True
+        )
+
 def main():
     """Starts the bot using the Application builder pattern."""
     try:
@@ -378,29 +589,20 @@ def main():
         return
 
     logger.info("Initializing Telegram Application...")
-    
-    # Start Flask in a separate thread
-    flask_thread = threading.Thread(target=run_flask, daemon=True)
-    flask_thread.start()
-    logger.info("Flask web server started in background thread")
-    
-    # Create the Application
-    application = Application.builder().token(config.BOT_TOKEN).build()
-
-    # Add command handlers
-    application.add_handler(CommandHandler("start", rss_bot.start_command))
-    application.add_handler(CommandHandler("status", rss_bot.status_command))
-    application.add_handler(CommandHandler("stop", rss_bot.stop_command))
-    application.add_handler(CommandHandler("check", rss_bot.force_check_command))
-    application.add_handler(CommandHandler("stats", rss_bot.stats_command))
 
-    logger.info("Bot is ready. Start polling...")
+    logger.info(f"Bot is ready. Start {'webhook' if config.WEBHOOK_URL else 'polling'}...")
     logger.info(f"Will check feed every {config.CHECK_INTERVAL_SECONDS} seconds")
     logger.info(f"Daily summary at {config.DAILY_SUMMARY_HOUR}:00")
-    logger.info(f"Web dashboard available at http://localhost:8000")
     
-    # Start polling - no port needed for Telegram polling
-    application.run_polling()
+    # A crash propagates and the process exits, so the process manager can
+    # restart it with fresh state (scheduled jobs included)
+    try:
+        run_application(build_application())
+    finally:
+        # Release worker threads; the log listener is flushed by atexit
+        io_pool.shutdown(wait=False, cancel_futures=True)
+        # Let a queued state write finish so the last sent links are kept
+        disk_pool.shutdown(wait=True)
 
 if __name__ == "__main__":
     main()
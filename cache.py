@@ -13,7 +13,8 @@ class CacheManager:
             endpoint="localhost",
             port=6379,
             serializer=JsonSerializer(),
-            namespace="telegram_bot"
+            namespace="telegram_bot",
+            timeout=1  # fail fast: callers treat the cache as best effort
         )
     
     async def get_user_quota(self, user_id: int) -> int:
@@ -33,5 +34,13 @@ class CacheManager:
     async def get_cached_image_url(self, image_hash: str) -> Optional[str]:
         """Get cached image URL"""
         return await self.cache.get(f"image:{image_hash}")
+    
+    async def cache_user_upload(self, user_id: int, image_hash: str, upload: dict):
+        """Cache one user's upload result (URL and delete link)"""
+        await self.cache.set(f"upload:{user_id}:{image_hash}", upload, ttl=86400)  # 24 hours
+    
+    async def get_cached_user_upload(self, user_id: int, image_hash: str) -> Optional[dict]:
+        """Get one user's cached upload result"""
+        return await self.cache.get(f"upload:{user_id}:{image_hash}")
 
 cache_manager = CacheManager()
@@ -1,34 +1,67 @@
-import os
-from typing import Set
+from env_bootstrap import env_snapshot, env_int
+
+# Shared environment snapshot, decoded once per process
+_ENV = env_snapshot()
+
+# Required settings and the placeholder default that counts as unset
+_REQUIRED_SETTINGS = (
+    ("BOT_TOKEN", "your_bot_token_here"),
+    ("CHAT_ID", "your_chat_id_here"),
+    ("RSS_FEED_URL", None),
+)
 
 class Config:
-    def __init__(self):
+    # Fixed attribute layout: no per-instance __dict__, typos raise AttributeError
+    __slots__ = (
+        "BOT_TOKEN", "CHAT_ID", "RSS_FEED_URL",
+        "CHECK_INTERVAL_SECONDS", "DAILY_SUMMARY_HOUR", "POLLING_TIMEOUT",
+        "SENT_LINKS_FILE", "LAST_SENT_FILE",
+        "WEBHOOK_URL", "WEBHOOK_PORT", "WEBHOOK_SECRET", "WEBHOOK_ENDPOINT",
+        "WEB_SERVER_HOST", "WEB_SERVER_PORT",
+    )
+
+    def __init__(self, env=_ENV):
         # Telegram Bot Configuration
-        self.BOT_TOKEN = os.getenv("BOT_TOKEN", "your_bot_token_here")
-        self.CHAT_ID = os.getenv("CHAT_ID", "your_chat_id_here")
+        self.BOT_TOKEN = env.get("BOT_TOKEN", "your_bot_token_here")
+        self.CHAT_ID = self._parse_chat_id(env.get("CHAT_ID", "your_chat_id_here"))
         
         # RSS Feed Configuration
-        self.RSS_FEED_URL = os.getenv("RSS_FEED_URL", "https://example.com/feed")
+        self.RSS_FEED_URL = env.get("RSS_FEED_URL", "https://example.com/feed")
         
         # Timing Configuration
-        self.CHECK_INTERVAL_SECONDS = int(os.getenv("CHECK_INTERVAL", 300))  # 5 minutes
-        self.DAILY_SUMMARY_HOUR = int(os.getenv("DAILY_SUMMARY_HOUR", 9))  # 9 AM
+        self.CHECK_INTERVAL_SECONDS = env_int(env, "CHECK_INTERVAL", 300)  # 5 minutes
+        self.DAILY_SUMMARY_HOUR = env_int(env, "DAILY_SUMMARY_HOUR", 9)  # 9 AM
+        self.POLLING_TIMEOUT = env_int(env, "POLLING_TIMEOUT", 25)  # long-poll seconds
         
         # File Paths
         self.SENT_LINKS_FILE = "sent_links.json"
         self.LAST_SENT_FILE = "last_sent.txt"
         
-        # Flask Configuration
-        self.FLASK_HOST = os.getenv("FLASK_HOST", "0.0.0.0")
-        self.FLASK_PORT = int(os.getenv("FLASK_PORT", 8000))
+        # Webhook Configuration (polling is used when WEBHOOK_URL is empty)
+        self.WEBHOOK_URL = env.get("WEBHOOK_URL", "")
+        self.WEBHOOK_PORT = env_int(env, "WEBHOOK_PORT", 8443)
+        self.WEBHOOK_SECRET = env.get("WEBHOOK_SECRET") or None
+        # Full URL Telegram posts to, derived once from the settings above
+        self.WEBHOOK_ENDPOINT = f"{self.WEBHOOK_URL.rstrip('/')}/{self.BOT_TOKEN}" if self.WEBHOOK_URL else ""
+        
+        # Web Dashboard Configuration
+        self.WEB_SERVER_HOST = env.get("WEB_SERVER_HOST", "0.0.0.0")
+        self.WEB_SERVER_PORT = env_int(env, "WEB_SERVER_PORT", 8000)
+    
+    @staticmethod
+    def _parse_chat_id(value):
+        """Convert numeric chat IDs to int once; keep @usernames as strings"""
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            return value
     
     def validate(self):
         """Validate configuration"""
-        if not self.BOT_TOKEN or self.BOT_TOKEN == "your_bot_token_here":
-            raise ValueError("BOT_TOKEN is not set")
-        if not self.CHAT_ID or self.CHAT_ID == "your_chat_id_here":
-            raise ValueError("CHAT_ID is not set")
-        if not self.RSS_FEED_URL:
-            raise ValueError("RSS_FEED_URL is not set")
+        for name, placeholder in _REQUIRED_SETTINGS:
+            value = getattr(self, name)
+            if not value or value == placeholder:
+                raise ValueError(f"{name} is not set")
 
 config = Config()
@@ -0,0 +1,27 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    """Load the .env file into os.environ exactly once per process"""
+    load_dotenv()
+    return True
+
+@lru_cache(maxsize=1)
+def env_snapshot() -> dict:
+    """Environment (with .env applied) decoded once and shared by every config module"""
+    load_env_once()
+    return dict(os.environ)
+
+def env_int(env, name, default=None, *, required=False):
+    """Read an integer setting, raising a ValueError that names the variable"""
+    value = env.get(name)
+    if value is None or not value.strip():
+        if required:
+            raise ValueError(f"{name} must be set")
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
@@ -32,4 +32,46 @@ class RateLimiter:
         self.user_requests[user_id].append(now)
         return True, 0
 
+class TokenBucket:
+    """Token bucket that smooths bursts of outbound messages to one chat"""
+    
+    def __init__(self, capacity: int = 30, refill_rate: float = 30 / 60):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+    
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+    
+    def consume(self, tokens: int = 1) -> bool:
+        """Take tokens if available without waiting"""
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return False
+        self._refill(now)
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+    
+    async def acquire(self, tokens: int = 1):
+        """Wait until tokens are available, yielding to other tasks meanwhile"""
+        while not self.consume(tokens):
+            now = time.monotonic()
+            if now < self.blocked_until:
+                delay = self.blocked_until - now
+            else:
+                delay = (tokens - self.tokens) / self.refill_rate
+            await asyncio.sleep(delay)
+    
+    def back_off(self, retry_after: float):
+        """Pause this bucket after Telegram answered with 429 Retry-After"""
+        self.blocked_until = time.monotonic() + retry_after
+        self.tokens = 0.0
+        self.updated_at = self.blocked_until
+
 rate_limiter = RateLimiter()
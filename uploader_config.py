@@ -1,14 +1,14 @@
-import os
-from dotenv import load_dotenv
+from env_bootstrap import env_snapshot
 
-load_dotenv()
+# Shared environment snapshot, decoded once per process
+_ENV = env_snapshot()
 
 class Config:
     # Telegram Bot Token
-    BOT_TOKEN = os.getenv('BOT_TOKEN')
+    BOT_TOKEN = _ENV.get('BOT_TOKEN')
     
     # ImgBB API Configuration
-    IMGBB_API_KEY = os.getenv('IMGBB_API_KEY')
+    IMGBB_API_KEY = _ENV.get('IMGBB_API_KEY')
     IMGBB_UPLOAD_URL = "https://api.imgbb.com/1/upload"
     
     # File size limits
@@ -18,10 +18,12 @@ class Config:
     # Status server
     STATUS_SERVER_URL = "http://localhost:8000"
 
+# Settings that must be present for the bot to start
+REQUIRED_VARS = ('BOT_TOKEN', 'IMGBB_API_KEY')
+
 # Validate required configuration
 def validate_config():
-    required_vars = ['BOT_TOKEN', 'IMGBB_API_KEY']
-    missing = [var for var in required_vars if not getattr(Config, var)]
+    missing = [var for var in REQUIRED_VARS if not getattr(Config, var)]
     if missing:
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
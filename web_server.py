@@ -1,8 +1,11 @@
+import logging
 from aiohttp import web
 import json
 from datetime import datetime
 from rss_bot import rss_bot, config
 
+logger = logging.getLogger(__name__)
+
 async def status_handler(request):
     """Handle status requests"""
     bot_status = rss_bot.get_bot_status()
@@ -185,8 +188,9 @@ async def start_web_server():
     site = web.TCPSite(runner, config.WEB_SERVER_HOST, config.WEB_SERVER_PORT)
     await site.start()
     
-    print(f"🌐 Web server running on http://{config.WEB_SERVER_HOST}:{config.WEB_SERVER_PORT}")
-    print(f"📊 Status page: http://{config.WEB_SERVER_HOST}:{config.WEB_SERVER_PORT}/status")
-    print(f"🔗 API endpoint: http://{config.WEB_SERVER_HOST}:{config.WEB_SERVER_PORT}/api/status")
+    logger.info(
+        "Web server running on http://%s:%d (status page /status, API /api/status)",
+        config.WEB_SERVER_HOST, config.WEB_SERVER_PORT
+    )
     
     return runner